@@ -75,9 +75,13 @@ API Key 安全管理模块。
     2026-02-22
 """
 
+import functools
+import threading
+import time
+
 import keyring
 import keyring.errors
-from typing import Final, Any
+from typing import ClassVar, Final, Any
 
 # =============================================================================
 # 常量定义
@@ -101,6 +105,27 @@ SERVICE_NAME: Final = "sgents"
     'sgents'
 """
 
+DEFAULT_CACHE_TTL: Final = 60.0
+"""
+API Key 内存缓存的默认有效期（秒）。
+
+在有效期内重复查询同一 username 时直接返回内存中的结果，
+不再访问系统凭据服务。
+
+类型：
+    Final[float]
+"""
+
+DEFAULT_NEGATIVE_CACHE_TTL: Final = 10.0
+"""
+"API Key 不存在" 查询结果的默认缓存有效期（秒）。
+
+比 DEFAULT_CACHE_TTL 短，便于在其他进程写入 API Key 后尽快被发现。
+
+类型：
+    Final[float]
+"""
+
 
 # =============================================================================
 # 异常类
@@ -133,6 +158,28 @@ class APIKeyError(Exception):
     pass
 
 
+# =============================================================================
+# 内部函数
+# =============================================================================
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_backend() -> Any:
+    """
+    解析当前进程使用的 keyring 后端。
+
+    keyring.get_keyring() 需要扫描并导入所有候选后端，开销较大。
+    由于后端在进程运行期间不会变化，结果只解析一次并缓存。
+
+    返回：
+        Any: keyring 后端实例。
+
+    注意：
+        测试中如需重新解析后端，可调用 _resolve_backend.cache_clear()。
+    """
+    return keyring.get_keyring()
+
+
 # =============================================================================
 # 核心类
 # =============================================================================
@@ -158,6 +205,15 @@ class APIKeyManager:
 
     属性：
         service_name (str): 服务名称标识符，用于在系统凭据中注册。
+        _cache (dict[str, tuple[str | None, float]]): 查询结果缓存，
+            以 username 为键，值为 (API Key, 写入时间戳)。
+        cache_ttl (float): 缓存有效期（秒）。默认为 DEFAULT_CACHE_TTL，
+            设为 0 可禁用缓存。
+        negative_cache_ttl (float): "不存在" 结果的缓存有效期（秒）。
+            默认为 DEFAULT_NEGATIVE_CACHE_TTL。
+        _lock (threading.Lock): 保护缓存读写的锁。
+        _instances (dict[str, APIKeyManager]): 按 service_name 共享的实例表
+            （类属性）。
 
     示例：
         创建管理器实例::
@@ -174,11 +230,42 @@ class APIKeyManager:
         首次使用前请确保系统凭据服务已正确配置。Linux 用户可能需要
         安装额外的依赖包（如 gnome-keyring）。
 
+        同一 service_name 只会创建一个实例，重复构造返回已有实例，
+        不同 username 共享同一个管理器及其缓存。
+
     参考：
         - keyring 文档：https://pypi.org/project/keyring/
         - PEP 257 文档字符串规范
     """
 
+    __slots__ = (
+        "service_name",
+        "_cache",
+        "cache_ttl",
+        "negative_cache_ttl",
+        "_lock",
+    )
+
+    _instances: ClassVar[dict[str, "APIKeyManager"]] = {}
+
+    def __new__(cls, service_name: str = SERVICE_NAME) -> "APIKeyManager":
+        """
+        返回指定 service_name 对应的共享实例。
+
+        如果该 service_name 已有实例，直接返回已有实例；否则创建新实例，
+        由 __init__ 在后端检查通过后登记到 _instances 中。
+
+        参数：
+            service_name (str, optional): 服务名称标识符。
+
+        返回：
+            APIKeyManager: 共享的管理器实例。
+        """
+        instance: APIKeyManager | None = cls._instances.get(service_name)
+        if instance is not None:
+            return instance
+        return super().__new__(cls)
+
     def __init__(self, service_name: str = SERVICE_NAME) -> None:
         """
         初始化 API Key 管理器。
@@ -205,12 +292,54 @@ class APIKeyManager:
 
                 manager = APIKeyManager(service_name="myapp")
 
+            禁用缓存::
+
+                manager = APIKeyManager()
+                manager.cache_ttl = 0
+                manager.negative_cache_ttl = 0
+
         注意：
             构造函数会自动调用 _check_backend() 验证后端可用性。
             如果验证失败，实例将不会创建成功。
+            对已存在的 service_name 重复构造时直接返回已有实例，
+            不会重新初始化。缓存有效期是共享实例上的属性，
+            可通过 cache_ttl 与 negative_cache_ttl 直接修改。
         """
+        if self._instances.get(service_name) is self:
+            return
+
         self.service_name: str = service_name
+        self._cache: dict[str, tuple[str | None, float]] = {}
+        self.cache_ttl: float = DEFAULT_CACHE_TTL
+        self.negative_cache_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL
+        self._lock: threading.Lock = threading.Lock()
         self._check_backend()
+        self._instances.setdefault(service_name, self)
+
+    def _get_cached(self, username: str) -> tuple[str | None, float] | None:
+        """
+        获取指定 username 仍在有效期内的缓存条目。
+
+        存在的 API Key 使用 cache_ttl，"不存在"（None）使用较短的
+        negative_cache_ttl。
+
+        参数：
+            username (str): 用户名标识符。
+
+        返回：
+            tuple[str | None, float] | None: 有效的缓存条目；
+                未缓存或已过期时返回 None。
+        """
+        with self._lock:
+            cached: tuple[str | None, float] | None = self._cache.get(username)
+        if cached is None:
+            return None
+        ttl: float = (
+            self.cache_ttl if cached[0] is not None else self.negative_cache_ttl
+        )
+        if time.monotonic() - cached[1] < ttl:
+            return cached
+        return None
 
     def _check_backend(self) -> None:
         """
@@ -240,8 +369,11 @@ class APIKeyManager:
         示例：
             >>> manager = APIKeyManager()  # 自动调用此方法
             >>> manager._check_backend()   # 手动检查
+
+        注意：
+            后端解析结果由 _resolve_backend() 缓存，每个进程只解析一次。
         """
-        backend: Any = keyring.get_keyring()
+        backend: Any = _resolve_backend()
         if backend.priority == 0:
             raise APIKeyError(
                 "未找到可用的密钥后端！\n"
@@ -299,15 +431,18 @@ class APIKeyManager:
             - 日志文件
             - 版本控制系统
         """
-        if not api_key or not api_key.strip():
+        stripped_key: str = api_key.strip() if api_key else ""
+        if not stripped_key:
             raise APIKeyError("API Key 不能为空")
 
         try:
             keyring.set_password(
                 service_name=self.service_name,
                 username=username,
-                password=api_key.strip(),
+                password=stripped_key,
             )
+            with self._lock:
+                self._cache[username] = (stripped_key, time.monotonic())
             return True
         except keyring.errors.InitError as e:
             raise APIKeyError(f"密钥后端初始化失败：{e}")
@@ -357,16 +492,24 @@ class APIKeyManager:
             - 返回值为 None 表示未找到或检索失败
             - 建议使用 has_api_key() 先检查是否存在
             - 检索操作是同步的
+            - 查询结果会在内存中缓存 cache_ttl 秒，期间不再访问系统凭据服务；
+              "不存在" 的结果只缓存 negative_cache_ttl 秒
 
         安全性：
             - 返回的 API Key 不应记录到日志中
             - 使用完成后应及时从内存中清除
             - 建议使用掩码显示（如显示前 10 位）
         """
+        cached: tuple[str | None, float] | None = self._get_cached(username)
+        if cached is not None:
+            return cached[0]
+
         try:
             api_key: str | None = keyring.get_password(
                 service_name=self.service_name, username=username
             )
+            with self._lock:
+                self._cache[username] = (api_key, time.monotonic())
             return api_key
         except keyring.errors.NoKeyringError:
             raise APIKeyError("密钥后端不可用")
@@ -410,6 +553,9 @@ class APIKeyManager:
             - 不会留下任何痕迹或备份
             - 适合在用户注销或重置配置时使用
         """
+        with self._lock:
+            self._cache.pop(username, None)
+
         try:
             keyring.delete_password(service_name=self.service_name, username=username)
             return True
@@ -422,7 +568,7 @@ class APIKeyManager:
         """
         检查指定用户是否存在 API Key。
 
-        快速检查指定的 username 是否已存储 API Key，无需获取完整内容。
+        检查指定的 username 是否已存储 API Key。
 
         参数：
             username (str): 用户名标识符。
@@ -443,14 +589,18 @@ class APIKeyManager:
                 if not manager.has_api_key("default"):
                     manager.set_api_key(input("输入 API Key: "), "default")
 
+        异常：
+            APIKeyError: 当密钥后端不可用时抛出。
+
         注意：
-            - 此方法内部调用 get_api_key()
+            - 此方法内部调用 get_api_key()，与其共享查询结果缓存
             - 返回 True 仅表示存在，不保证 API Key 有效
             - 适合在程序启动时进行配置检查
 
         性能：
-            此方法会访问系统凭据存储，可能有轻微的性能开销。
-            建议在程序初始化时调用，避免在循环中频繁调用。
+            缓存有效期内再次检查（或随后调用 get_api_key()）时直接返回，
+            不访问系统凭据存储。"存在" 的结果缓存 cache_ttl 秒，
+            "不存在" 的结果缓存 negative_cache_ttl 秒。
         """
         return self.get_api_key(username) is not None
 
@@ -510,7 +660,8 @@ API Key 管理器全局单例实例。
 注意：
     - 此实例在模块导入时自动初始化
     - 如果系统凭据后端不可用，导入时会抛出 APIKeyError
-    - 多用户场景建议创建新的 APIKeyManager 实例
+    - 多用户场景直接通过 username 参数区分即可；以相同 service_name
+      构造 APIKeyManager 会返回此实例
 
 参考：
     APIKeyManager 类文档
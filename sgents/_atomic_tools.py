@@ -58,21 +58,54 @@ _atomic_tools 工具模块。
     2026-02-22
 """
 
+import asyncio
 import subprocess
 import os
+import shlex
+import shutil
+import signal
 from pathlib import Path
 from dataclasses import dataclass
 import re
 from typing import Final
 
 
+SHELL_METACHARACTERS: Final = frozenset("|&;<>()$`*?~#[]{}!\n")
+"""
+需要交给 shell 解释的特殊字符。
+
+命令中包含这些字符（管道、重定向、变量展开、通配符、注释、
+花括号展开、历史展开等）时，execute_command 会回退到 shell 执行，
+否则直接以 argv 方式启动进程。
+"""
+
+SHELL_BUILTINS: Final = frozenset({
+    # POSIX 特殊内置命令
+    "break", ":", "continue", ".", "eval", "exec", "exit", "export",
+    "readonly", "return", "set", "shift", "times", "trap", "unset",
+    # POSIX 常规内置命令
+    "alias", "bg", "cd", "command", "false", "fc", "fg", "getopts", "hash",
+    "jobs", "kill", "newgrp", "pwd", "read", "true", "type", "ulimit",
+    "umask", "unalias", "wait",
+    # 各 shell 普遍内置的命令
+    "echo", "printf", "test", "[", "source",
+})
+"""
+shell 内置命令。
+
+这些命令即使在 PATH 中存在同名可执行文件（如 /bin/echo），
+行为也可能与 shell 内置版本不同（如 dash 的 echo 会解释 "\\t"），
+因此总是交给 shell 执行。
+"""
+
+
 @dataclass(frozen=True)
 class Config:
     """
     工具模块配置类。
 
     使用冻结的数据类确保配置不可变，保证线程安全。
-    初始化后会自动创建工作区目录。
+    工作区目录不会在初始化时创建，而是由 AtomicTools 在首次文件操作时创建。
 
     属性：
         workspace: 工作区根目录路径。所有文件操作限制在此目录内。
@@ -114,11 +147,10 @@ class Config:
         """
         初始化后处理。
 
-        解析工作区路径为绝对路径，并创建工作区目录。
+        解析工作区路径为绝对路径。
         由于数据类是 frozen 的，使用 object.__setattr__ 修改属性。
         """
         object.__setattr__(self, "workspace", self.workspace.resolve())
-        self.workspace.mkdir(parents=True, exist_ok=True)
 
 
 class AtomicTools:
@@ -136,6 +168,10 @@ class AtomicTools:
     属性：
         config: 工具配置对象。
         _start_path: Sandboxie Start.exe 路径。
+        _abs_workspace: 解析后的工作区绝对路径（初始化时计算一次）。
+        _abs_workspace_str: _abs_workspace 的字符串形式，用于快速拼接路径。
+        _sandbox_available: 沙箱是否启用且 Start.exe 存在（初始化时检测一次）。
+        _workspace_ready: 工作区目录是否已创建。
         PACKAGE_PATTERN: 包名验证正则表达式（类常量）。
 
     示例：
@@ -153,9 +189,21 @@ class AtomicTools:
 
     注意：
         所有方法都是异步的（async），以兼容 AutoGen 框架。
+        阻塞的文件读写通过 asyncio.to_thread 在线程池中执行，不会阻塞事件循环。
     """
 
-    PACKAGE_PATTERN: Final = re.compile(r"^[a-zA-Z0-9_-]+(\[[a-zA-Z0-9_-]+\])?$")
+    __slots__ = (
+        "config",
+        "_start_path",
+        "_abs_workspace",
+        "_abs_workspace_str",
+        "_sandbox_available",
+        "_workspace_ready",
+    )
+
+    PACKAGE_PATTERN: Final = re.compile(
+        r"[a-zA-Z0-9_-]+(?:\[[a-zA-Z0-9_-]+\])?", re.ASCII
+    )
 
     def __init__(self, config: Config) -> None:
         """
@@ -170,6 +218,23 @@ class AtomicTools:
         """
         self.config: Config = config
         self._start_path: Path = Path(self.config.sandbox_path) / "Start.exe"
+        self._abs_workspace: Path = self.config.workspace.resolve()
+        self._abs_workspace_str: str = str(self._abs_workspace)
+        self._sandbox_available: bool = (
+            self.config.sandbox_enabled and self._start_path.exists()
+        )
+        self._workspace_ready: bool = False
+
+    def _ensure_workspace(self) -> None:
+        """
+        确保工作区目录存在。
+
+        首次调用时创建工作区目录（包括父目录），之后直接返回。
+        避免在导入模块或创建配置时产生文件系统操作。
+        """
+        if not self._workspace_ready:
+            self.config.workspace.mkdir(parents=True, exist_ok=True)
+            self._workspace_ready = True
 
     def _validate_package_name(self, package_name: str) -> bool:
         """
@@ -196,7 +261,9 @@ class AtomicTools:
                 tools._validate_package_name("requests; rm -rf /")  # False
                 tools._validate_package_name("../evil")  # False
         """
-        return bool(self.PACKAGE_PATTERN.match(package_name))
+        # 预编译正则的 fullmatch 已在 C 层完成扫描，实测比手写的逐字符
+        # 校验（frozenset / str.translate）更快，因此保留正则实现。
+        return self.PACKAGE_PATTERN.fullmatch(package_name) is not None
 
     def _get_safe_path(self, filename: str) -> Path:
         """
@@ -225,17 +292,118 @@ class AtomicTools:
                 path = tools._get_safe_path("../etc/passwd")
                 # 抛出：ValueError: 非法路径访问
         """
-        target_path: Path = self.config.workspace / filename
+        # 目标路径不做缓存：符号链接可能在两次调用之间被替换
+        target_path: Path = Path(os.path.join(self._abs_workspace_str, filename))
         abs_target: Path = target_path.resolve()
-        abs_workspace: Path = self.config.workspace.resolve()
+        abs_workspace: Path = self._abs_workspace
 
-        try:
-            abs_target.relative_to(abs_workspace)
-        except ValueError:
+        if not abs_target.is_relative_to(abs_workspace):
             raise ValueError(f"非法路径访问：{filename} (超出工作区范围)")
 
         return abs_target
 
+    def _write_text(self, target_file: Path, content: str, mode: str) -> None:
+        """
+        以指定模式将文本写入文件（同步）。
+
+        供异步方法通过 asyncio.to_thread 调用，避免阻塞事件循环。
+
+        Args:
+            target_file: 已通过 _get_safe_path 校验的文件路径。
+            content: 要写入的内容。
+            mode: 文件打开模式，"w" 为覆盖，"a" 为追加。
+        """
+        with open(target_file, mode=mode, encoding=self.config.default_encoding) as f:
+            f.write(content)
+
+    def _read_bytes(self, target_path: Path, limit: int) -> bytes:
+        """
+        以二进制模式读取文件前 limit 个字节（同步）。
+
+        供异步方法通过 asyncio.to_thread 调用，避免阻塞事件循环。
+
+        Args:
+            target_path: 已通过 _get_safe_path 校验的文件路径。
+            limit: 最多读取的字节数。
+
+        Returns:
+            读取到的原始字节。
+        """
+        with open(target_path, mode="rb") as f:
+            return f.read(limit)
+
+    def _decode_text(self, data: bytes, errors: str) -> str:
+        """
+        将原始字节解码为文本。
+
+        使用配置的默认编码解码，并将 "\\r\\n" 与单独的 "\\r" 统一为
+        "\\n"（与文本模式的通用换行一致）。read_file 与 execute_command
+        共用此方法，保证两者的换行处理一致。
+
+        Args:
+            data: 原始字节。
+            errors: 解码错误处理方式，如 "replace"、"ignore"。
+
+        Returns:
+            解码后的文本。
+        """
+        text: str = data.decode(self.config.default_encoding, errors=errors)
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    def _kill_process_tree(self, process: asyncio.subprocess.Process) -> None:
+        """
+        强制结束子进程及其派生的所有进程。
+
+        子进程以 start_new_session=True 启动，自成一个进程组，
+        POSIX 平台上通过 os.killpg 结束整个进程组，避免 shell 派生的
+        子进程（如 "sleep 5 | cat" 中的 sleep）在超时后继续运行并持有管道。
+        Windows 平台没有进程组信号，退化为只结束子进程本身。
+
+        Args:
+            process: 要结束的子进程。
+        """
+        if os.name == "nt":
+            process.kill()
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _build_argv(self, command: str) -> list[str] | None:
+        """
+        将命令拆分为 argv 列表，以便不经 shell 直接启动进程。
+
+        以下情况返回 None，由调用方回退到 shell 执行：
+            - Windows 平台（cmd.exe 的内置命令和引号规则无法用 argv 还原；
+              Sandboxie 只存在于 Windows，因此沙箱命令也总是经过 shell）
+            - 命令包含 SHELL_METACHARACTERS 中的字符
+            - 命令以环境变量赋值开头（如 FOO=bar cmd）
+            - 引号不匹配等无法解析的情况
+            - 命令名是 SHELL_BUILTINS 中的 shell 内置命令（如 cd、echo、printf）
+            - PATH 中找不到对应的可执行文件
+
+        Args:
+            command: 要执行的命令。
+
+        Returns:
+            argv 列表；需要 shell 时返回 None。
+        """
+        if os.name == "nt" or not SHELL_METACHARACTERS.isdisjoint(command):
+            return None
+        try:
+            argv: list[str] = shlex.split(command)
+        except ValueError:
+            return None
+        if (
+            not argv
+            or "=" in argv[0]
+            or argv[0] in SHELL_BUILTINS
+            or shutil.which(argv[0]) is None
+        ):
+            return None
+        return argv
+
     async def make_new_dir(self, dir_name: str) -> str:
         """
         创建新目录。
@@ -258,6 +426,7 @@ class AtomicTools:
                 # 自动创建父目录
         """
         try:
+            self._ensure_workspace()
             target_dir: Path = self._get_safe_path(dir_name)
             target_dir.mkdir(parents=True, exist_ok=True)
             return f"目录 {target_dir} 创建成功。"
@@ -300,13 +469,11 @@ class AtomicTools:
             - 使用配置的默认编码（UTF-8）
         """
         try:
+            self._ensure_workspace()
             target_file: Path = self._get_safe_path(file_path)
             target_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(
-                target_file, mode="w", encoding=self.config.default_encoding
-            ) as f:
-                f.write(content)
+            await asyncio.to_thread(self._write_text, target_file, content, "w")
 
             return f"文件 {target_file} 写入成功。"
         except ValueError as e:
@@ -343,13 +510,11 @@ class AtomicTools:
             - 不会覆盖原有内容
         """
         try:
+            self._ensure_workspace()
             target_file: Path = self._get_safe_path(file_path)
             target_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(
-                target_file, mode="a", encoding=self.config.default_encoding
-            ) as f:
-                f.write(content)
+            await asyncio.to_thread(self._write_text, target_file, content, "a")
 
             return f"已向 {target_file} 追加内容。"
         except ValueError as e:
@@ -384,32 +549,63 @@ class AtomicTools:
         注意：
             - 文件过大时只返回前 100KB
             - 自动处理编码错误（忽略无法解码的字符）
+            - 如需原始字节，请使用 read_file_bytes
         """
         try:
+            self._ensure_workspace()
             target_path: Path = self._get_safe_path(file_path)
             if not target_path.exists():
                 return f"错误：文件 {file_path} 不存在。"
             if target_path.is_dir():
                 return f"错误：{file_path} 是一个目录，请使用 list_files 查看。"
 
-            file_size: int = target_path.stat().st_size
             limit: int = self.config.max_file_size
 
-            with open(
-                target_path,
-                mode="r",
-                encoding=self.config.default_encoding,
-                errors="ignore",
-            ) as f:
-                content: str = f.read(limit)
-                if file_size > limit:
-                    content += "\n... (文件过大，仅显示前 100KB 内容)"
-                return content
+            # 多读一个字节用于判断是否截断，省去一次 stat 调用
+            data: bytes = await asyncio.to_thread(
+                self._read_bytes, target_path, limit + 1
+            )
+            content: str = self._decode_text(data[:limit], "ignore")
+            if len(data) > limit:
+                content += "\n... (文件过大，仅显示前 100KB 内容)"
+            return content
         except ValueError as e:
             return f"错误：{e}"
         except Exception as e:
             return f"读取失败：{e}"
 
+    async def read_file_bytes(self, file_path: str) -> bytes:
+        """
+        以二进制形式读取指定文件的内容。
+
+        不做解码，直接返回原始字节，适合调用方自行处理编码或
+        原样转发内容的场景。文件过大时只返回前 max_file_size 字节。
+
+        Args:
+            file_path: 文件路径（相对于工作区）。
+
+        Returns:
+            文件的原始字节内容（最多 max_file_size 字节）。
+
+        Raises:
+            ValueError: 如果路径超出工作区范围。
+            FileNotFoundError: 如果文件不存在。
+            IsADirectoryError: 如果路径是一个目录。
+
+        示例：
+            读取图片::
+
+                data = await tools.read_file_bytes("logo.png")
+
+        注意：
+            - 与 read_file 不同，此方法出错时抛出异常而不是返回错误信息
+            - 超出大小限制的部分会被直接丢弃，不附加截断提示
+        """
+        self._ensure_workspace()
+        target_path: Path = self._get_safe_path(file_path)
+        limit: int = self.config.max_file_size
+        return await asyncio.to_thread(self._read_bytes, target_path, limit)
+
     async def list_files(self, dir_name: str = "./") -> str:
         """
         列出指定目录下的文件和子目录。
@@ -440,22 +636,28 @@ class AtomicTools:
             - 按名称字母排序
         """
         try:
+            self._ensure_workspace()
             target_dir: Path = self._get_safe_path(dir_name)
             if not target_dir.exists():
                 return f"错误：目录 {dir_name} 不存在。"
 
-            items: list[Path] = list(target_dir.iterdir())
-            if not items:
+            # os.scandir 的 DirEntry 会缓存类型信息，避免逐项额外 stat
+            with os.scandir(target_dir) as it:
+                entries: list[os.DirEntry[str]] = sorted(
+                    it, key=lambda entry: (not entry.is_dir(), entry.name)
+                )
+            if not entries:
                 return "目录为空。"
 
             result: list[str] = []
-            for item in items:
-                prefix: str = "[DIR] " if item.is_dir() else "[FILE]"
-                if item.is_file():
-                    size: int = item.stat().st_size
-                    result.append(f"{prefix} {item.name} ({size} bytes)")
+            result_append = result.append
+            for entry in entries:
+                if entry.is_dir():
+                    result_append(f"[DIR]  {entry.name}")
+                elif entry.is_file():
+                    result_append(f"[FILE] {entry.name} ({entry.stat().st_size} bytes)")
                 else:
-                    result.append(f"{prefix} {item.name}")
+                    result_append(f"[FILE] {entry.name}")
 
             return "\n".join(result)
         except ValueError as e:
@@ -493,46 +695,74 @@ class AtomicTools:
 
         注意：
             - 如果启用沙箱，命令会在 Sandboxie 中执行
+            - Start.exe 是否存在只在创建实例时检测一次
+            - 子进程环境变量在每次执行时基于当前的 os.environ 生成
             - 输出长度有限制（防止内存溢出）
-            - 超时时间为配置的超时值（默认 60 秒）
+            - 超时时间为配置的超时值（默认 60 秒），超时后会结束命令
+              派生的所有进程
+            - 命令以异步子进程执行，等待期间不阻塞事件循环
+            - 普通命令直接以 argv 启动，不经过 shell；包含管道、重定向
+              等 shell 语法的命令（以及 Windows 平台）仍通过 shell 执行
         """
-        run_command: str = ""
-        if self.config.sandbox_enabled and os.path.exists(self._start_path):
-            run_command = f'"{self._start_path}" {command}'
-        else:
-            run_command = command
+        argv: list[str] | None = self._build_argv(command)
+        env: dict[str, str] = {
+            **os.environ,
+            "PYTHONIOENCODING": self.config.default_encoding,
+        }
 
         try:
-            env: dict[str, str] = os.environ.copy()
-            env["PYTHONIOENCODING"] = self.config.default_encoding
-
-            result: subprocess.CompletedProcess[str] = subprocess.run(
-                run_command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                encoding=self.config.default_encoding,
-                errors="replace",
-                timeout=self.config.command_timeout,
-                env=env,
-            )
-
-            output: str = f"返回码：{result.returncode}\n"
-
-            if result.stdout:
-                stdout: str = result.stdout[: self.config.max_output_length]
+            process: asyncio.subprocess.Process
+            if argv is not None:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=env,
+                    start_new_session=True,
+                )
+            else:
+                run_command: str = command
+                if self._sandbox_available:
+                    run_command = f'"{self._start_path}" {command}'
+                process = await asyncio.create_subprocess_shell(
+                    run_command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=env,
+                    start_new_session=True,
+                )
+            try:
+                raw_stdout, raw_stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=self.config.command_timeout
+                )
+            except TimeoutError:
+                self._kill_process_tree(process)
+                await process.wait()
+                return "错误：命令执行超时。"
+            except BaseException:
+                # 任务被取消（如 AutoGen 的 CancellationToken）或收到 Ctrl-C 时，
+                # 子进程处于独立会话中不会随之退出，需要显式结束
+                self._kill_process_tree(process)
+                await process.wait()
+                raise
+
+            result_stdout: str = self._decode_text(raw_stdout, "replace")
+            result_stderr: str = self._decode_text(raw_stderr, "replace")
+
+            output: str = f"返回码：{process.returncode}\n"
+
+            if result_stdout:
+                stdout: str = result_stdout[: self.config.max_output_length]
                 output += f"输出:\n{stdout}\n"
-                if len(result.stdout) > self.config.max_output_length:
+                if len(result_stdout) > self.config.max_output_length:
                     output += "\n... (输出过长，已截断)"
 
-            if result.stderr:
-                stderr: str = result.stderr[: self.config.max_output_length]
+            if result_stderr:
+                stderr: str = result_stderr[: self.config.max_output_length]
                 output += f"错误:\n{stderr}"
-                if len(result.stderr) > self.config.max_output_length:
+                if len(result_stderr) > self.config.max_output_length:
                     output += "\n... (错误信息过长，已截断)"
             return output
-        except subprocess.TimeoutExpired:
-            return "错误：命令执行超时。"
         except Exception as e:
             return f"错误：{e}"
 
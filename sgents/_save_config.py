@@ -76,6 +76,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
             "max_output_length": 50000
         })
 
+    合并多次 set() 的写入::
+
+        with config_manager:
+            config_manager.set("sandbox_enabled", False)
+            config_manager.set("command_timeout", 120)
+        # 退出 with 块时只写入一次文件
+
     重置为默认配置::
 
         config_manager.reset()
@@ -94,14 +101,34 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
     - Google Python Style Guide: Comments and Docstrings
 """
 
+import atexit
 import json
+import os
+import sys
+import weakref
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType, TracebackType
 from typing import Any, TYPE_CHECKING, Final
 
+from loguru import logger
+
+try:
+    import orjson as _json_fast
+
+    _HAS_ORJSON: Final = True
+except ImportError:
+    _HAS_ORJSON: Final = False  # type: ignore[misc]
+
 if TYPE_CHECKING:
     from ._atomic_tools import Config
 
+#: _atomic_tools.Config 类，首次调用 to_config() 时导入。
+_Config: "type[Config] | None" = None
+
 
+#: 默认配置字典，配置文件不存在或解析失败时使用。
+#: 修改默认值应直接编辑此字典，不要使用 set() 方法。
 DEFAULT_CONFIG: Final[dict[str, Any]] = {
     "workspace": "./workspace",
     "sandbox_enabled": True,
@@ -111,27 +138,36 @@ DEFAULT_CONFIG: Final[dict[str, Any]] = {
     "max_file_size": 1024 * 100,
     "default_encoding": "utf-8",
 }
-"""
-默认配置字典。
 
-包含所有配置项的默认值，在配置文件不存在或解析失败时使用。
-此字典为冻结常量，不应直接修改。
 
-配置项：
-    workspace: 默认工作区路径为 "./workspace"
-    sandbox_enabled: 默认启用沙箱
-    sandbox_path: 默认 Sandboxie 安装路径
-    command_timeout: 默认超时 60 秒
-    max_output_length: 默认输出限制 10000 字符
-    max_file_size: 默认文件大小限制 100KB
-    default_encoding: 默认编码 UTF-8
+def _is_positive(value: Any) -> bool:
+    """判断配置值是否大于 0。"""
+    return value > 0
 
-类型：
-    Final[dict[str, Any]]
 
-注意：
-    修改默认值应直接编辑此字典，不要使用 set() 方法。
-"""
+#: 配置验证规则表。每条规则为 (配置键, 默认值, 校验函数, 错误信息)，
+#: 校验函数返回 False 时 validate() 报告对应的错误信息。
+#: sandbox_path 的规则依赖 sandbox_enabled，在 validate() 中单独检查。
+_VALIDATORS: Final[tuple[tuple[str, Any, Callable[[Any], bool], str], ...]] = (
+    ("workspace", "./workspace", bool, "workspace 不能为空"),
+    ("command_timeout", 60, _is_positive, "command_timeout 必须大于 0"),
+    ("max_output_length", 10000, _is_positive, "max_output_length 必须大于 0"),
+    ("max_file_size", 1024 * 100, _is_positive, "max_file_size 必须大于 0"),
+)
+
+
+#: 仍存活的 ConfigManager 实例。使用弱引用集合，
+#: 程序退出时的自动保存不会让实例一直存活到退出。
+_live_managers: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers() -> None:
+    """程序退出时保存所有存活实例中未保存的修改。"""
+    for manager in list(_live_managers):
+        manager._flush_if_dirty()
+
+
+atexit.register(_flush_live_managers)
 
 
 class ConfigManager:
@@ -142,15 +178,16 @@ class ConfigManager:
     配置文件格式为 JSON。
 
     本类提供完整的配置生命周期管理，包括：
-    - 初始化时自动加载配置文件
+    - 首次访问配置时自动加载配置文件
     - 配置不存在时自动创建默认配置
-    - 配置修改后自动保存到磁盘
+    - 配置修改后自动保存到磁盘（with 块内的修改在退出时合并保存）
     - 配置值验证（检查必填项和有效范围）
     - 转换为 _atomic_tools.Config 对象
 
     属性：
         config_path (Path): 配置文件路径。
-        config (dict[str, Any]): 当前配置字典。
+        config (dict[str, Any]): 当前配置字典。首次访问时才从磁盘加载。
+        autosave (bool): 是否在 set()/update() 后自动保存。
 
     线程安全性：
         本类不是线程安全的。多线程环境下应使用锁保护。
@@ -184,9 +221,16 @@ class ConfigManager:
             config = config_manager.to_config()
             tools = AtomicTools(config)
 
+        批量修改::
+
+            with config_manager:
+                config_manager.set("sandbox_enabled", False)
+                config_manager.set("command_timeout", 120)
+
     注意：
         配置文件会在首次加载时自动创建（如果不存在）。
-        所有修改会立即保存到文件。
+        所有修改默认立即保存到文件；在 with 块内的修改会在退出时
+        合并为一次写入。实例在程序退出时仍存活的，未保存的修改会自动写入。
         配置文件格式为 JSON，可手动编辑。
 
     参考：
@@ -194,24 +238,23 @@ class ConfigManager:
         - Google Python Style Guide: Comments and Docstrings
     """
 
-    def __init__(self, config_path: str = "config.json") -> None:
+    def __init__(self, config_path: str = "config.json", autosave: bool = True) -> None:
         """
         初始化配置管理器。
 
-        创建配置管理器实例，加载配置文件。如果配置文件不存在，
-        会自动创建默认配置并保存。
+        创建配置管理器实例。配置文件不会在此时读取，而是在首次访问
+        配置时加载；如果配置文件不存在，届时会自动创建默认配置并保存。
 
         Args:
             config_path: 配置文件路径。默认为 "config.json"。
                 可以是相对路径或绝对路径。
+            autosave: 是否在 set()/update() 后自动保存。默认为 True。
+                设为 False 时修改只保留在内存中，需手动调用 save()，
+                或在程序退出时自动写入。
 
         Returns:
             None
 
-        Raises:
-            PermissionError: 如果无法创建配置文件或工作区目录。
-            OSError: 如果文件系统错误。
-
         示例：
             默认配置路径::
 
@@ -223,22 +266,133 @@ class ConfigManager:
                 manager = ConfigManager("/etc/sgents/config.json")
 
         注意：
-            此方法会自动调用 load() 加载配置。
-            配置文件会在初始化时自动创建（如果不存在）。
+            此方法不会访问文件系统。
+            首次调用 get()、set() 等方法或访问 config 属性时才会调用 load()。
         """
         self.config_path: Path = Path(config_path)
-        self.config: dict[str, Any] = {}
-        self.load()
+        self.autosave: bool = autosave
+        self._config: Mapping[str, Any] = {}
+        self._loaded: bool = False
+        self._dirty: bool = False
+        self._batch_depth: int = 0
+        self._config_obj_cache: "Config | None" = None
+        self._cached_snapshot: dict[str, Any] | None = None
+        _live_managers.add(self)
+
+    def __enter__(self) -> "ConfigManager":
+        """
+        进入批量修改模式。
+
+        在 with 块内调用 set()/update() 只会标记配置已修改，
+        不会立即写入文件。支持嵌套使用。
+
+        Returns:
+            ConfigManager: 当前实例。
+        """
+        self._batch_depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        退出批量修改模式。
+
+        退出最外层 with 块时，如果配置有未保存的修改，写入一次文件。
+        """
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._flush_if_dirty()
+
+    def _flush_if_dirty(self) -> None:
+        """
+        如果配置有未保存的修改，保存到文件。
+
+        在退出 with 块和程序退出时调用。
+        """
+        if self._dirty:
+            self.save()
+
+    def _mark_dirty(self) -> None:
+        """
+        标记配置已修改，并在需要时立即保存。
+
+        autosave 为 True 且不在 with 块内时立即调用 save()，
+        否则延迟到退出 with 块、手动 save() 或程序退出时保存。
+        """
+        self._dirty = True
+        if self.autosave and self._batch_depth == 0:
+            self.save()
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """
+        当前配置字典（可修改）。
+
+        首次访问时从磁盘加载配置文件。如果当前配置仍是 DEFAULT_CONFIG
+        的只读视图，会在此时复制为独立的字典（写时复制）。
+
+        Returns:
+            dict[str, Any]: 当前配置字典。
+        """
+        self._ensure_loaded()
+        if not isinstance(self._config, dict):
+            self._config = dict(self._config)
+        return self._config
+
+    @config.setter
+    def config(self, value: Mapping[str, Any]) -> None:
+        self._config = value
+        self._loaded = True
+
+    def _config_view(self) -> Mapping[str, Any]:
+        """
+        返回当前配置的只读访问视图。
+
+        供内部读取使用，不会触发写时复制。
+
+        Returns:
+            Mapping[str, Any]: 当前配置映射。
+        """
+        self._ensure_loaded()
+        return self._config
 
-    def load(self) -> dict[str, Any]:
+    def _serializable(self) -> dict[str, Any]:
+        """
+        返回可直接序列化为 JSON 的配置字典。
+
+        json 与 orjson 都不接受 MappingProxyType，只读视图需要临时转换。
+
+        Returns:
+            dict[str, Any]: 配置字典。
+        """
+        view: Mapping[str, Any] = self._config_view()
+        return view if isinstance(view, dict) else dict(view)
+
+    def _ensure_loaded(self) -> None:
+        """
+        确保配置已加载。
+
+        如果尚未加载配置文件，调用 load() 加载；否则直接返回。
+        """
+        if not self._loaded:
+            self.load()
+
+    def load(self) -> Mapping[str, Any]:
         """
         加载配置文件。
 
         从磁盘加载配置文件。如果配置文件不存在，创建默认配置并保存。
-        如果配置文件解析失败（JSON 格式错误），使用默认配置。
+        如果配置文件解析失败（JSON 格式或编码错误），先将原文件重命名为
+        "<文件名>.corrupt"（已存在时依次使用 ".corrupt.1"、".corrupt.2" 等）
+        以便手动恢复，记录警告后使用默认配置并保存。
 
         Returns:
-            dict[str, Any]: 配置字典。包含所有配置项的键值对。
+            Mapping[str, Any]: 配置映射。包含所有配置项的键值对。
+                使用默认配置时为 DEFAULT_CONFIG 的只读视图。
 
         Raises:
             PermissionError: 如果无法读取或写入配置文件。
@@ -256,23 +410,51 @@ class ConfigManager:
                 manager.load()
 
         注意：
-            此方法会在初始化时自动调用。
+            此方法会在首次访问配置时自动调用。
             手动调用会重新加载配置（覆盖未保存的修改）。
             配置文件不存在时会自动创建。
         """
+        self._loaded = True
+        self._dirty = False
         if not self.config_path.exists():
-            self.config = DEFAULT_CONFIG.copy()
+            self.config = MappingProxyType(DEFAULT_CONFIG)
             self.save()
-            return self.config
+            return self._config
 
         try:
-            with open(self.config_path, mode="r", encoding="utf-8") as f:
-                self.config = json.load(f)
-        except json.JSONDecodeError:
-            self.config = DEFAULT_CONFIG.copy()
+            loaded: dict[str, Any] = json.loads(self.config_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            corrupt_path: Path = self._free_corrupt_path()
+            os.replace(self.config_path, corrupt_path)
+            logger.warning(
+                f"配置文件 {self.config_path} 解析失败，已移动到 {corrupt_path}，"
+                f"使用默认配置：{e}"
+            )
+            self.config = MappingProxyType(DEFAULT_CONFIG)
             self.save()
+        else:
+            # JSON 解析出的键不会被驻留，驻留后与代码中的字面量键查找更快
+            self.config = {sys.intern(key): value for key, value in loaded.items()}
 
-        return self.config
+        return self._config
+
+    def _free_corrupt_path(self) -> Path:
+        """
+        返回一个尚不存在的损坏配置备份路径。
+
+        依次尝试 "<文件名>.corrupt"、"<文件名>.corrupt.1"、"<文件名>.corrupt.2" 等，
+        不会覆盖之前保留的备份。
+
+        Returns:
+            Path: 可用的备份文件路径。
+        """
+        base: str = self.config_path.name + ".corrupt"
+        corrupt_path: Path = self.config_path.with_name(base)
+        counter: int = 0
+        while corrupt_path.exists():
+            counter += 1
+            corrupt_path = self.config_path.with_name(f"{base}.{counter}")
+        return corrupt_path
 
     def save(self) -> None:
         """
@@ -280,6 +462,8 @@ class ConfigManager:
 
         将当前配置写入 JSON 文件。如果父目录不存在，会自动创建。
         配置文件格式化为带缩进的 JSON，便于人工阅读和编辑。
+        先写入同目录下的临时文件，再通过 os.replace 原子替换，
+        写入中途出错不会留下损坏的配置文件。
 
         Returns:
             None
@@ -300,14 +484,32 @@ class ConfigManager:
                 manager.save()
 
         注意：
-            set() 方法会自动调用 save()。
-            update() 方法会自动调用 save()。
-            批量修改后建议手动调用一次 save()。
+            安装了 orjson 时使用 orjson 序列化，否则使用标准库 json。
+            配置先序列化为 UTF-8 字节再以二进制模式一次写入，不做换行符转换。
+            set() 方法会自动调用 save()（with 块内除外）。
+            update() 方法会自动调用 save()（with 块内除外）。
+            批量修改建议使用 with 块，退出时只保存一次。
         """
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.config_path, mode="w", encoding="utf-8") as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        payload: bytes
+        if _HAS_ORJSON:
+            payload = _json_fast.dumps(
+                self._serializable(),
+                option=_json_fast.OPT_INDENT_2 | _json_fast.OPT_NON_STR_KEYS,
+            )
+        else:
+            payload = json.dumps(
+                self._serializable(), indent=2, ensure_ascii=False
+            ).encode("utf-8")
+        tmp_path: Path = self.config_path.with_suffix(self.config_path.suffix + ".tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._dirty = False
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -337,7 +539,7 @@ class ConfigManager:
             此方法不会修改配置。
             返回的值是配置的引用，修改会影响原配置。
         """
-        return self.config.get(key, default)
+        return self._config_view().get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -370,11 +572,11 @@ class ConfigManager:
                 manager.set("workspace", "./new_workspace")
 
         注意：
-            此方法会自动保存配置到文件。
-            批量修改建议使用 update() 方法（只保存一次）。
+            此方法会自动保存配置到文件（autosave 为 False 或在 with 块内时除外）。
+            批量修改建议使用 update() 方法或 with 块（只保存一次）。
         """
         self.config[key] = value
-        self.save()
+        self._mark_dirty()
 
     def update(self, config_dict: dict[str, Any]) -> None:
         """
@@ -413,7 +615,7 @@ class ConfigManager:
             会覆盖现有配置项，不会删除未提供的配置项。
         """
         self.config.update(config_dict)
-        self.save()
+        self._mark_dirty()
 
     def validate(self) -> tuple[bool, list[str]]:
         """
@@ -443,7 +645,7 @@ class ConfigManager:
                 valid, errors = manager.validate()
                 assert valid, f"配置验证失败：{errors}"
 
-        验证项目：
+        验证项目（规则定义见模块级 _VALIDATORS）：
             workspace: 不能为空字符串
             sandbox_path: 沙箱启用时不能为空字符串
             command_timeout: 必须大于 0
@@ -454,28 +656,15 @@ class ConfigManager:
             此方法不会修改配置。
             验证失败时配置仍可正常使用，但可能导致运行时错误。
         """
-        errors: list[str] = []
-
-        workspace: str = self.get("workspace", "./workspace")
-        if not workspace:
-            errors.append("workspace 不能为空")
-
-        if self.get("sandbox_enabled", True):
-            sandbox_path: str = self.get("sandbox_path", "")
-            if not sandbox_path:
-                errors.append("sandbox_path 不能为空")
-
-        timeout: int = self.get("command_timeout", 60)
-        if timeout <= 0:
-            errors.append("command_timeout 必须大于 0")
-
-        max_output: int = self.get("max_output_length", 10000)
-        if max_output <= 0:
-            errors.append("max_output_length 必须大于 0")
+        config: Mapping[str, Any] = self._config_view()
+        errors: list[str] = [
+            message
+            for key, default, is_valid, message in _VALIDATORS
+            if not is_valid(config.get(key, default))
+        ]
 
-        max_file: int = self.get("max_file_size", 1024 * 100)
-        if max_file <= 0:
-            errors.append("max_file_size 必须大于 0")
+        if config.get("sandbox_enabled", True) and not config.get("sandbox_path", ""):
+            errors.append("sandbox_path 不能为空")
 
         return (len(errors) == 0, errors)
 
@@ -507,13 +696,22 @@ class ConfigManager:
                 await tools.write_in_file("test.txt", "Hello")
 
         注意：
-            此方法会导入 _atomic_tools 模块。
+            此方法会在首次调用时导入 _atomic_tools 模块。
             确保 _atomic_tools 模块已存在。
             返回的 Config 对象是冻结的，不可修改。
+            配置未修改时重复调用会返回同一个 Config 对象。
+            是否修改通过与上次转换时的配置快照比较判断，
+            因此直接修改 config 字典也会生效。
         """
-        from ._atomic_tools import Config
+        global _Config
+        view: Mapping[str, Any] = self._config_view()
+        if self._config_obj_cache is not None and view == self._cached_snapshot:
+            return self._config_obj_cache
 
-        return Config(
+        if _Config is None:
+            from ._atomic_tools import Config as _Config
+
+        self._config_obj_cache = _Config(
             workspace=Path(self.get("workspace", "./workspace")),
             sandbox_enabled=self.get("sandbox_enabled", True),
             sandbox_path=self.get("sandbox_path", r"D:\sandboxieplus\Sandboxie-Plus"),
@@ -522,6 +720,8 @@ class ConfigManager:
             max_file_size=self.get("max_file_size", 1024 * 100),
             default_encoding=self.get("default_encoding", "utf-8"),
         )
+        self._cached_snapshot = dict(view)
+        return self._config_obj_cache
 
     def reset(self) -> None:
         """
@@ -555,7 +755,7 @@ class ConfigManager:
         """
         if self.config_path.exists():
             self.config_path.unlink()
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = MappingProxyType(DEFAULT_CONFIG)
         self.save()
 
     def show(self) -> str:
@@ -581,64 +781,47 @@ class ConfigManager:
             返回的字符串包含所有配置项。
             不包含敏感信息（如 API Key）。
         """
-        return json.dumps(self.config, indent=2, ensure_ascii=False)
-
-
-config_manager: Final = ConfigManager()
-"""
-全局配置管理器实例。
-
-使用默认配置路径（"config.json"）创建的 ConfigManager 实例。
-适用于大多数单用户场景，无需手动创建配置管理器实例。
-
-类型：
-    Final[ConfigManager]
+        if _HAS_ORJSON:
+            return _json_fast.dumps(
+                self._serializable(),
+                option=_json_fast.OPT_INDENT_2 | _json_fast.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        return json.dumps(self._serializable(), indent=2, ensure_ascii=False)
 
-示例：
-    基本用法::
 
-        from config_manager import config_manager
+#: 全局配置管理器实例，通过模块属性 config_manager 访问。
+#: 使用默认配置路径（"config.json"），在首次访问时创建，适用于大多数单用户场景；
+#: 多用户场景建议创建新的 ConfigManager 实例。
+_config_manager: ConfigManager | None = None
 
-        workspace = config_manager.get("workspace")
-        config_manager.set("sandbox_enabled", False)
 
-    验证配置::
+def __getattr__(name: str) -> Any:
+    """
+    模块级属性的延迟访问（PEP 562）。
 
-        valid, errors = config_manager.validate()
-        if not valid:
-            print("配置错误：", errors)
+    访问 config_manager 时才创建全局 ConfigManager 实例，
+    避免导入本模块时产生任何磁盘读写。
 
-    转换为 Config 对象::
+    Args:
+        name: 属性名称。
 
-        config = config_manager.to_config()
+    Returns:
+        Any: name 为 "config_manager" 时返回全局配置管理器实例。
 
-注意：
-    此实例在模块导入时自动初始化。
-    如果配置文件路径有问题，导入时会报错。
-    多用户场景建议创建新的 ConfigManager 实例。
-"""
+    Raises:
+        AttributeError: 如果模块没有该属性。
+    """
+    global _config_manager
+    if name == "config_manager":
+        if _config_manager is None:
+            _config_manager = ConfigManager()
+        return _config_manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+#: 模块公共 API，不在此列表中的符号不应在模块外使用。
 __all__: Final = [
     "ConfigManager",
     "config_manager",
     "DEFAULT_CONFIG",
 ]
-"""
-模块导出列表。
-
-定义使用 `from config_manager import *` 时导出的符号。
-包含公共 API，不包括内部实现细节。
-
-导出项：
-    ConfigManager: 配置管理器类。
-    config_manager: 全局配置管理器实例。
-    DEFAULT_CONFIG: 默认配置字典。
-
-类型：
-    Final[list[str]]
-
-注意：
-    不在 __all__ 中的符号不应直接导入。
-    内部函数和变量不应在模块外使用。
-"""
@@ -1,28 +1,50 @@
+import time
+from collections.abc import Callable, Mapping
 from datetime import datetime
+from functools import cache, cached_property
 from enum import StrEnum
-from typing import Any, Self, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
-import questionary
-from rich.align import Align
-from rich.box import DOUBLE
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:
+    import questionary
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
 
 
-console = Console()
+# rich and questionary are imported on first use, so importing this module stays cheap.
+@cache
+def _get_console() -> "Console":
+    """Create the shared rich console on first use."""
+    from rich.console import Console
 
+    return Console()
 
-menu_style = questionary.Style(
-    [
-        ("qmark", "#787DFF bold"),
-        ("question", "#787DFF bold"),
-        ("answer", "#9787FF"),
-        ("pointer", "#9787FF"),
-        ("highlighted", "#9787FF bold")
-    ]
-)
-"""Generic questionary menu style."""
+
+@cache
+def _get_menu_style() -> "questionary.Style":
+    """Create the generic questionary menu style on first use."""
+    import questionary
+
+    return questionary.Style(
+        [
+            ("qmark", "#787DFF bold"),
+            ("question", "#787DFF bold"),
+            ("answer", "#9787FF"),
+            ("pointer", "#9787FF"),
+            ("highlighted", "#9787FF bold")
+        ]
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provide `console` and `menu_style` as module attributes."""
+    if name == "console":
+        return _get_console()
+    if name == "menu_style":
+        return _get_menu_style()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 LOGO = r"""[#787DFF]                          __      [/]
@@ -35,55 +57,73 @@ LOGO = r"""[#787DFF]                          __      [/]
 
 
 # ============================== Multiple Language Supports ==============================
-def lang(key: str, mapping: dict[str, Any] = {
-        "agent_state_STANDBY": "就绪",
-        "sandbox_status_True": "启用",
-        "sandbox_status_False": "禁用",
-
-        "show_launching_banner_title": "Sgents 控制台",
-        "show_launching_banner_subtitle": "使用上下键选择，Enter 确认",
-
-        "show_status_bar_time_format": "%Y/%m/%d %H:%M:%S",
-        "show_status_bar_statues_text": "[#9898FF]Agent：[/][#787DFF]{}[/] [#9898FF]| 沙箱：[/][#787DFF]{}[/] [#9898FF]| 任务：[/][#787DFF]{}[/] [#9898FF]| 启动时间：[/][#787DFF]{}[/]",
-        "show_status_bar_title": "Agent 状态",
-
-        "show_agent_status_headers": ("角色", "状态", "工具"),
-        "show_agent_status_title": "Agent 团队状态",
-        "show_agent_status_table": (
-            ("代码编写", "就绪"),
-            ("代码审查", "就绪"),
-            ("任务执行", "就绪"),
-            ("协调整合", "就绪")
-        ),
-
-        "ask_by_main_menu_message": "请选择操作：",
-        "ask_by_main_menu_choices": (
-            "执行新任务",
-            "查看历史任务",
-            "浏览工作区",
-            "Agent 团队状态",
-            "配置设置",
-            "退出"
-        ),
-
-        "ask_by_task_type_menu_message": "选择任务类型：",
-        "ask_by_task_type_menu_choices": (
-            "网页爬取",
-            "数据处理",
-            "文件操作",
-            "系统命令",
-            "多 Agent 协作",
-            "返回"
-        ),
-
-        "ask_for_task_description_prompt": "请输入任务描述：",
-
-        "ask_confirm_return_message": "按 Enter 返回",
-
-        "main_choice1": "\n[#9898FF]任务 '{}' 执行成功！[/]\n",
-    }
-) -> str:
-    return mapping[key]
+#: Chinese UI strings (read-only).
+_LANG_ZH: Final[Mapping[str, Any]] = MappingProxyType({
+    "agent_state_STANDBY": "就绪",
+    "sandbox_status_True": "启用",
+    "sandbox_status_False": "禁用",
+
+    "show_launching_banner_title": "Sgents 控制台",
+    "show_launching_banner_subtitle": "使用上下键选择，Enter 确认",
+
+    "show_status_bar_time_format": "%Y/%m/%d %H:%M:%S",
+    "show_status_bar_statues_text": "[#9898FF]Agent：[/][#787DFF]{}[/] [#9898FF]| 沙箱：[/][#787DFF]{}[/] [#9898FF]| 任务：[/][#787DFF]{}[/] [#9898FF]| 启动时间：[/][#787DFF]{}[/]",
+    "show_status_bar_title": "Agent 状态",
+
+    "show_agent_status_headers": ("角色", "状态", "工具"),
+    "show_agent_status_title": "Agent 团队状态",
+    "show_agent_status_table": (
+        ("代码编写", "就绪"),
+        ("代码审查", "就绪"),
+        ("任务执行", "就绪"),
+        ("协调整合", "就绪")
+    ),
+
+    "ask_by_main_menu_message": "请选择操作：",
+    "ask_by_main_menu_choices": (
+        "执行新任务",
+        "查看历史任务",
+        "浏览工作区",
+        "Agent 团队状态",
+        "配置设置",
+        "退出"
+    ),
+
+    "ask_by_task_type_menu_message": "选择任务类型：",
+    "ask_by_task_type_menu_choices": (
+        "网页爬取",
+        "数据处理",
+        "文件操作",
+        "系统命令",
+        "多 Agent 协作",
+        "返回"
+    ),
+
+    "ask_for_task_description_prompt": "请输入任务描述：",
+
+    "ask_confirm_return_message": "按 Enter 返回",
+
+    "main_choice1": "\n[#9898FF]任务 '{}' 执行成功！[/]\n",
+})
+
+#: Look up a UI string by key.
+lang: Final[Callable[[str], Any]] = _LANG_ZH.__getitem__
+
+#: Choices of the main menu.
+_MAIN_CHOICES: Final[tuple[str, ...]] = lang("ask_by_main_menu_choices")
+
+#: Individual main menu choices, named so dispatch does not depend on their order.
+(
+    _CHOICE_NEW_TASK,
+    _CHOICE_HISTORY,
+    _CHOICE_WORKSPACE,
+    _CHOICE_AGENTS,
+    _CHOICE_SETTINGS,
+    _CHOICE_EXIT,
+) = _MAIN_CHOICES
+
+#: Choices of the task type submenu; the last one returns to the main menu.
+_TASK_CHOICES: Final[tuple[str, ...]] = lang("ask_by_task_type_menu_choices")
 
 
 # ============================== Interface Impletementation ==============================
@@ -98,49 +138,77 @@ class AgentState(StrEnum):
 class Interface:
     """
     Represents an user interface.
-    Only one instance of `Interface` can exist at the same time.
+    Use `get_interface` to obtain the shared instance.
     """
 
-    __instance: Interface | None = None
-
-    def __new__(cls) -> Self:
-        # Impletement single instance mode.
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-        return cast(Self, cls.__instance)
+    _STATUS_TEXT_TEMPLATE: Final[str] = lang("show_status_bar_statues_text")
+    _STATUS_TITLE: Final[str] = lang("show_status_bar_title")
+    _TIME_FORMAT: Final[str] = lang("show_status_bar_time_format")
+    _AGENT_ROWS: Final = (("Coder", "3"), ("Reviewer", "2"), ("Executor", "4"), ("Manager", "1"))
 
     def __init__(self) -> None:
         self.task_count: int = 0
         self.agent_status: AgentState = AgentState.STANDBY
         self.sandbox_status: bool = True
+        self._last_time_sec: int = -1
+        self._last_time_str: str = ""
 
-    def show_launching_banner(self):
-        """Show the launching banner."""
-        console.clear()
-        print()
+    @cached_property
+    def _banner_panel(self) -> "Panel":
+        """The launching banner panel, built once since its content never changes."""
+        from rich.align import Align
+        from rich.panel import Panel
 
-        panel = Panel(
+        return Panel(
             Align.center(LOGO),
             title=lang("show_launching_banner_title"),
             subtitle=lang("show_launching_banner_subtitle"),
             border_style="#9787FF"
         )
-        console.print(panel)
+
+    @cached_property
+    def _agent_table(self) -> "Table":
+        """The agent group status table, built once since its content never changes."""
+        from rich.table import Table
+
+        table = Table(
+            "Agent", *lang("show_agent_status_headers"),
+            title=lang("show_agent_status_title"),
+            border_style="#9787FF", title_style="#9787FF bold", header_style="#9898FF"
+        )
+        for (name, tools), row in zip(self._AGENT_ROWS, lang("show_agent_status_table")):
+            table.add_row(name, *row, tools, style="#B9B3FF")
+        return table
+
+    def show_launching_banner(self):
+        """Show the launching banner."""
+        console = _get_console()
+        console.clear()
+        print()
+        console.print(self._banner_panel)
         print()
     
     def show_status_bar(self) -> None:
         """Show the status bar."""
-        current_time = datetime.now().strftime(lang("show_status_bar_time_format"))
-        statues_text = lang("show_status_bar_statues_text").format(
+        from rich.box import DOUBLE
+        from rich.panel import Panel
+
+        # Only reformat the clock when the displayed second changes.
+        now_sec = int(time.time())
+        if now_sec != self._last_time_sec:
+            self._last_time_str = datetime.fromtimestamp(now_sec).strftime(self._TIME_FORMAT)
+            self._last_time_sec = now_sec
+        current_time = self._last_time_str
+        statues_text = self._STATUS_TEXT_TEMPLATE.format(
             self.agent_status,
             lang("sandbox_status_True") if self.sandbox_status else lang("sandbox_status_False"),
             self.task_count, current_time
         )
-        console.print(
+        _get_console().print(
             Panel(
                 statues_text,
                 box=DOUBLE,
-                title=lang("show_status_bar_title"),
+                title=self._STATUS_TITLE,
                 border_style="#9787FF"
             )
         )
@@ -148,74 +216,94 @@ class Interface:
     
     def show_agent_status(self):
         """Show the status of the agent group."""
-        table = Table(
-            "Agent", *lang("show_agent_status_headers"),
-            title=lang("show_agent_status_title"),
-            border_style="#9787FF", title_style="#9787FF bold", header_style="#9898FF"
-        )
-        row1, row2, row3, row4 = lang("show_agent_status_table")
-        table.add_row("Coder", *row1, "3", style="#B9B3FF")
-        table.add_row("Reviewer", *row2, "2", style="#B9B3FF")
-        table.add_row("Executor", *row3, "4", style="#B9B3FF")
-        table.add_row("Manager", *row4, "1", style="#B9B3FF")
-        console.print(table)
+        _get_console().print(self._agent_table)
         print()
     
     def ask_by_main_menu(self) -> Any:
         """Display the main menu."""
+        import questionary
+
         return questionary.select(
             lang("ask_by_main_menu_message"),
-            lang("ask_by_main_menu_choices"),
-            style=menu_style,
+            _MAIN_CHOICES,
+            style=_get_menu_style(),
             use_arrow_keys=True
         ).ask()
     
     def ask_by_task_type_menu(self) -> Any:
         """Display the submenu which asks for the type of mission going to start."""
+        import questionary
+
         return questionary.select(
             lang("ask_by_task_type_menu_message"),
-            lang("ask_by_main_menu_choices"),
-            style=menu_style,
+            _TASK_CHOICES,
+            style=_get_menu_style(),
             use_arrow_keys=True
         ).ask()
 
     def ask_for_task_description(self) -> Any:
         """Ask for the description of the mission."""
-        return questionary.text(lang("ask_for_task_description_prompt"), style=menu_style).ask()
+        import questionary
+
+        return questionary.text(lang("ask_for_task_description_prompt"), style=_get_menu_style()).ask()
 
     def ask_confirm_return(self) -> Any:
         """Ask whether actually returning."""
+        import questionary
+
         return questionary.confirm(lang("ask_confirm_return_message")).ask()
 
+    def _run_new_task(self) -> None:
+        """Ask for a task type and description, then run the task."""
+        task_type = self.ask_by_task_type_menu()
+        if task_type and task_type != _TASK_CHOICES[-1]:
+            task_desc = self.ask_for_task_description()
+            if task_desc:
+                self.task_count += 1
+                _get_console().print(lang("main_choice1").format(task_desc))
+            self.ask_confirm_return()
+
+    def _show_history(self) -> None:
+        """Show the task history."""
+        _get_console().print(f"[yellow]历史任务功能开发中...[/]\n")
+        self.ask_confirm_return()
+
+    def _browse_workspace(self) -> None:
+        """Browse the workspace."""
+        _get_console().print(f"[yellow]工作区浏览功能开发中...[/]\n")
+        self.ask_confirm_return()
+
+    def _show_agents(self) -> None:
+        """Show the agent group status table."""
+        self.show_agent_status()
+        self.ask_confirm_return()
+
+    def _open_settings(self) -> None:
+        """Open the settings."""
+        _get_console().print(f"[yellow]配置设置功能开发中...[/]\n")
+        self.ask_confirm_return()
+
+    #: Maps each main menu choice to its handler. `_CHOICE_EXIT` and a cancelled prompt have none.
+    _MAIN_HANDLERS: Final[Mapping[str, Callable[["Interface"], None]]] = MappingProxyType({
+        _CHOICE_NEW_TASK: _run_new_task,
+        _CHOICE_HISTORY: _show_history,
+        _CHOICE_WORKSPACE: _browse_workspace,
+        _CHOICE_AGENTS: _show_agents,
+        _CHOICE_SETTINGS: _open_settings,
+    })
+
     def main(self):
+        console = _get_console()
         while True:
             try:
                 self.show_launching_banner()
                 self.show_status_bar()
 
-                choose = self.ask_by_main_menu()
-
-                match lang("ask_by_main_menu_choices").index(choose):
-                    case 0:
-                        task_type = self.ask_by_task_type_menu()
-                        if task_type and task_type != lang("ask_by_task_type_menu_choices")[-1]:
-                            task_desc = self.ask_for_task_description()
-                            if task_desc:
-                                self.task_count += 1
-                                console.print(lang("main_choice1").format(task_desc))
-                            self.ask_confirm_return()
-                    case 1:
-                        console.print(f"[yellow]历史任务功能开发中...[/]\n")
-                    case 2:
-                        console.print(f"[yellow]工作区浏览功能开发中...[/]\n")
-                    case 3:
-                        console.print(f"[yellow]配置设置功能开发中...[/]\n")
-                    case 4:
-                        self.show_agent_status()
-                        self.ask_confirm_return()
-                    case _:
-                        console.print(f"\n[#9898FF]再见！[/]\n")
-                        break
+                handler = self._MAIN_HANDLERS.get(self.ask_by_main_menu())
+                if handler is None:
+                    console.print(f"\n[#9898FF]再见！[/]\n")
+                    break
+                handler(self)
             except KeyboardInterrupt:
                 console.print(f"\n\n[yellow]用户中断 (Ctrl+C)[/]\n")
                 continue
@@ -224,4 +312,19 @@ class Interface:
                 self.ask_confirm_return()
 
 
-Interface().ask_by_main_menu()
+@cache
+def get_interface() -> Interface:
+    """Return the shared `Interface`, creating it on first call."""
+    return Interface()
+
+
+__all__: Final = [
+    "Interface",
+    "get_interface",
+    "AgentState",
+    "console",
+]
+
+
+if __name__ == "__main__":
+    get_interface().main()